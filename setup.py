@@ -0,0 +1,16 @@
+"""Optional mypyc build: SIM_MYPYC=1 compiles sim/runner.py into a C extension.
+
+Metadata lives in pyproject.toml; without SIM_MYPYC this is a plain pure-Python build.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("SIM_MYPYC"):
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["sim/runner.py"], opt_level="3")
+
+setup(ext_modules=ext_modules)
@@ -14,9 +14,20 @@ def cli() -> None:
 @click.option("--config", required=True, help="YAML pipeline config")
 @click.option("--out", "out_dir", required=True, help="Output directory for artifacts/logs")
 @click.option("--dry", is_flag=True, help="Parse + validate only; no work is executed")
-def run(config: str, out_dir: str, dry: bool) -> None:
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Max concurrent modules/tests per phase (default: up to 32)",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=False,
+    help="Reuse module digests from <out>/.digest_cache.json across runs",
+)
+def run(config: str, out_dir: str, dry: bool, jobs: int | None, cache: bool) -> None:
     """Run the pipeline."""
-    code = run_pipeline(config, out_dir, dry_run=dry)
+    code = run_pipeline(config, out_dir, dry_run=dry, jobs=jobs, cache=cache)
     raise SystemExit(code)
 
 
@@ -1,14 +1,30 @@
 from __future__ import annotations
 
 import csv
+import functools
 import hashlib
 import json
+import os
 import time
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import yaml
 
+try:  # libyaml-backed parser when available; pure-Python fallback otherwise
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+try:  # optional Rust JSON encoder for telemetry output (pip install .[fast])
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 
 # ========= Exceptions (messages live in the classes; no inline strings at raise sites) =========
 class ConfigError(Exception):
@@ -55,10 +71,99 @@ class NegativeTestSecondsError(ConfigError):
         super().__init__(f"Test {test_name!r} has negative 'seconds'.")
 
 
+class UnknownDependencyError(ConfigError):
+    def __init__(self, module_name: str, dep: str) -> None:
+        super().__init__(f"Module {module_name!r} depends on unknown module {dep!r}.")
+
+
+class InvalidDependsOnError(ConfigError):
+    def __init__(self, module_name: str) -> None:
+        super().__init__(f"Module {module_name!r} 'depends_on' must be a name or a list of names.")
+
+
+class DependencyCycleError(ConfigError):
+    def __init__(self, names: list[str]) -> None:
+        super().__init__(f"Dependency cycle among modules: {sorted(names)}")
+
+
+class UnknownHashAlgorithmError(ValueError):
+    def __init__(self, value: str) -> None:
+        super().__init__(f"SIM_HASH must be one of {list(HASH_ALGOS)}, got {value!r}.")
+
+
+# =================================== Telemetry ===================================
+TELEMETRY_FIELDS = ("stage", "name", "duration_s", "meta")
+
+
+@dataclass(slots=True, frozen=True)
+class TelemetryRow:
+    """One telemetry event; built once and rendered for each output format."""
+
+    stage: str
+    name: str
+    duration_s: float
+    meta: Any
+
+    def as_csv(self) -> tuple[str, str, str, str]:
+        meta = self.meta if isinstance(self.meta, str) else _json_str(self.meta)
+        return (self.stage, self.name, f"{self.duration_s:.4f}", meta)
+
+    def as_ndjson(self) -> bytes:
+        return _ndjson_line(
+            {
+                "stage": self.stage,
+                "name": self.name,
+                "duration_s": self.duration_s,
+                "meta": self.meta,
+            }
+        )
+
+
+@dataclass
+class Telemetry:
+    """Telemetry rows stored column-wise: one list per field, appended in lockstep."""
+
+    stages: list[str] = field(default_factory=list)
+    names: list[str] = field(default_factory=list)
+    durations: list[float] = field(default_factory=list)
+    metas: list[Any] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.stages)
+
+    def extend(self, rows: list[TelemetryRow]) -> None:
+        self.stages.extend([r.stage for r in rows])
+        self.names.extend([r.name for r in rows])
+        self.durations.extend([r.duration_s for r in rows])
+        self.metas.extend([r.meta for r in rows])
+
+    def rows(self) -> Iterator[tuple[str, str, float, Any]]:
+        """Iterate (stage, name, duration_s, meta) tuples in insertion order."""
+        return zip(self.stages, self.names, self.durations, self.metas, strict=True)
+
+
 # =================================== Core helpers ===================================
+# SIM_HASH=blake2b opts into a faster digest; it changes every digest, so sha256 stays default.
+HASH_ALGOS = ("sha256", "blake2b")
+
+
+def _hash_algo(value: str) -> str:
+    algo = value.strip().lower()
+    if algo not in HASH_ALGOS:
+        raise UnknownHashAlgorithmError(value)
+    return algo
+
+
+_HASH_ALGO = _hash_algo(os.environ.get("SIM_HASH", "sha256"))
+
+
+@functools.lru_cache(maxsize=4096)
 def _digest(name: str, payload: str) -> str:
     """Deterministic artifact digest for a module (no sleep)."""
-    return hashlib.sha256((name + payload).encode()).hexdigest()
+    h = hashlib.blake2b(digest_size=32) if _HASH_ALGO == "blake2b" else hashlib.sha256()
+    h.update(name.encode())
+    h.update(payload.encode())
+    return h.hexdigest()
 
 
 def _do_work(name: str, payload: str, seconds: float) -> tuple[str, float]:
@@ -66,35 +171,143 @@ def _do_work(name: str, payload: str, seconds: float) -> tuple[str, float]:
     Simulate unit of work by sleeping a capped duration and returning a digest + duration.
     Digest is deterministic for (name, payload).
     """
-    t0 = time.time()
+    t0 = time.perf_counter_ns()
     time.sleep(max(0.0, min(seconds, 2.0)))  # cap to keep CI fast
     digest = _digest(name, payload)
-    return digest, time.time() - t0
+    return digest, (time.perf_counter_ns() - t0) * 1e-9
+
+
+def _json_bytes(obj: Any, *, indent: bool = False) -> bytes:
+    """UTF-8 JSON bytes (compact, or 2-space indented), ready for Path.write_bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode()
+    return _json_str(obj).encode()
+
+
+def _json_str(obj: Any) -> str:
+    """Compact JSON text; orjson when installed, identical output from json otherwise."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _ndjson_line(obj: Any) -> bytes:
+    """Encode one compact NDJSON line as UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return (_json_str(obj) + "\n").encode()
+
+
+def _write_phase_rows(writer: Any, f_nd: BinaryIO, rows: list[TelemetryRow]) -> None:
+    """Flush one phase's telemetry: a single CSV writerows() and a single NDJSON write."""
+    writer.writerows([r.as_csv() for r in rows])
+    f_nd.write(b"".join([r.as_ndjson() for r in rows]))
+
+
+def _cache_key(name: str, payload: str) -> str:
+    return f"{_HASH_ALGO}\0{name}\0{payload}"
+
+
+def _load_digest_cache(path: Path) -> dict[str, str]:
+    """Read the on-disk digest cache; a missing or unreadable file is an empty cache."""
+    try:
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {k: v for k, v in data.items() if isinstance(k, str) and isinstance(v, str)}
+
+
+def _build_module(task: tuple[str, str, float], cache: dict[str, str]) -> tuple[str, float, bool]:
+    """Build one module, or reuse its cached digest without sleeping. Returns a hit flag."""
+    name, payload, seconds = task
+    cached = cache.get(_cache_key(name, payload))
+    if cached is not None:
+        return cached, 0.0, True
+    digest, dur = _do_work(name, payload, seconds)
+    return digest, dur, False
+
+
+def _max_workers(jobs: int | None, n_tasks: int) -> int:
+    """Thread count for a phase: `jobs` if given (else up to 32), never more than tasks."""
+    return max(1, min(jobs or 32, n_tasks))
 
 
 def _load_config(config_path: str) -> dict[str, Any]:
     raw = Path(config_path).read_text(encoding="utf-8")
-    cfg: Any = yaml.safe_load(raw) or {}
+    cfg: Any = yaml.load(raw, Loader=_Loader) or {}
     if not isinstance(cfg, dict):
         raise NotMappingError()
     return dict(cfg)
 
 
-def _validate_modules(mods: list[dict[str, Any]]) -> None:
-    names = [str(m.get("name", "")).strip() for m in mods]
-    if any(not n for n in names):
-        raise EmptyModuleNameError()
+def _module_deps(m: dict[str, Any]) -> list[str]:
+    deps = m.get("depends_on")
+    if deps is None:
+        return []
+    if isinstance(deps, str):
+        deps = [deps]
+    if not isinstance(deps, list):
+        raise InvalidDependsOnError(str(m.get("name", "")).strip())
+    return [str(d).strip() for d in deps]
 
-    dupes = sorted({n for n in names if names.count(n) > 1})
-    if dupes:
-        raise DuplicateModuleNamesError(dupes)
 
+def _module_waves(mods: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """
+    Group modules into dependency waves via Kahn's algorithm (O(V+E)).
+    Every module in a wave depends only on modules from earlier waves;
+    within a wave, config order is kept.
+    """
+    by_name = {str(m.get("name", "")).strip(): m for m in mods}
+    order = {n: i for i, n in enumerate(by_name)}
+    indegree = dict.fromkeys(by_name, 0)
+    dependents: dict[str, list[str]] = {n: [] for n in by_name}
+    for name, m in by_name.items():
+        for dep in _module_deps(m):
+            if dep not in by_name:
+                raise UnknownDependencyError(name, dep)
+            indegree[name] += 1
+            dependents[dep].append(name)
+
+    waves: list[list[dict[str, Any]]] = []
+    wave = [n for n, d in indegree.items() if d == 0]
+    while wave:
+        waves.append([by_name[n] for n in wave])
+        ready: list[str] = []
+        for n in wave:
+            for child in dependents[n]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    ready.append(child)
+        wave = sorted(ready, key=order.__getitem__)
+
+    if sum(len(w) for w in waves) < len(by_name):
+        raise DependencyCycleError([n for n, d in indegree.items() if d > 0])
+    return waves
+
+
+def _validate_modules(mods: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """Validate module entries and return their dependency waves (see _module_waves)."""
+    counts: Counter[str] = Counter()
     for m in mods:
+        name = str(m.get("name", "")).strip()
+        if not name:
+            raise EmptyModuleNameError()
+        counts[name] += 1
         if "payload" not in m:
             raise MissingPayloadError(m.get("name"))
         if "seconds" in m and float(m["seconds"]) < 0:
             raise NegativeModuleSecondsError(m.get("name"))
 
+    dupes = [n for n, c in counts.items() if c > 1]
+    if dupes:
+        raise DuplicateModuleNamesError(dupes)
+
+    return _module_waves(mods)  # raises on unknown dependencies or cycles
+
 
 def _validate_tests(tests: list[dict[str, Any]], mod_names: set[str]) -> None:
     for t in tests:
@@ -110,12 +323,17 @@ def _validate_tests(tests: list[dict[str, Any]], mod_names: set[str]) -> None:
             raise NegativeTestSecondsError(name)
 
 
-def validate_config(config_path: str) -> None:
-    cfg = _load_config(config_path)
+def _validate_cfg(cfg: dict[str, Any]) -> list[list[dict[str, Any]]]:
+    """Validate a parsed config; returns the module dependency waves for scheduling."""
     modules = list(cfg.get("modules", []) or [])
     tests = list(cfg.get("tests", []) or [])
-    _validate_modules(modules)
+    waves = _validate_modules(modules)
     _validate_tests(tests, {str(m.get("name")) for m in modules})
+    return waves
+
+
+def validate_config(config_path: str) -> None:
+    _validate_cfg(_load_config(config_path))
 
 
 def explain_config(config_path: str, *, include_digests: bool = False) -> dict[str, Any]:
@@ -133,6 +351,8 @@ def explain_config(config_path: str, *, include_digests: bool = False) -> dict[s
         payload = str(m.get("payload"))
         seconds = float(m.get("seconds", 0.2))
         item: dict[str, Any] = {"name": name, "payload": payload, "seconds": seconds}
+        if deps := _module_deps(m):
+            item["depends_on"] = deps
         if include_digests:
             item["expected_digest"] = _digest(name, payload)
         mod_list.append(item)
@@ -151,62 +371,41 @@ def explain_config(config_path: str, *, include_digests: bool = False) -> dict[s
 
 
 # =================================== Output helpers ===================================
-def _try_parquet_exports(
-    out: Path, telemetry_rows: list[dict[str, Any]], results_obj: dict[str, Any]
-) -> None:
-    """Best-effort Parquet exports using pandas+pyarrow if available."""
-    try:
-        import pandas as pd  # removed: type: ignore
+# Same replacements as html.escape(quote=True), applied in one str.translate pass
+_HTML_ESC = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
 
-        if telemetry_rows:
-            pd.DataFrame(telemetry_rows).to_parquet(out / "telemetry.parquet", index=False)
 
-        tests_df = pd.DataFrame(results_obj.get("tests", []))
-        tests_df.to_parquet(out / "results.parquet", index=False)
+def _try_parquet_exports(out: Path, telemetry: Telemetry, results_obj: dict[str, Any]) -> None:
+    """Best-effort Parquet exports using pyarrow if available."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if telemetry:
+            # meta mixes digests (str) and dicts; store it as one string column
+            metas = [m if isinstance(m, str) else _json_str(m) for m in telemetry.metas]
+            table = pa.Table.from_arrays(
+                [
+                    pa.array(telemetry.stages, pa.string()),
+                    pa.array(telemetry.names, pa.string()),
+                    pa.array(telemetry.durations, pa.float64()),
+                    pa.array(metas, pa.string()),
+                ],
+                names=list(TELEMETRY_FIELDS),
+            )
+            pq.write_table(table, out / "telemetry.parquet")
+
+        pq.write_table(pa.Table.from_pylist(results_obj.get("tests", [])), out / "results.parquet")
     except Exception as e:  # pragma: no cover
         (out / "parquet_export_failed.txt").write_text(
             f"Parquet export skipped or failed: {type(e).__name__}: {e}\n"
-            "Install pandas+pyarrow (see requirements-dev.txt) to enable.",
+            "Install pyarrow (see requirements-dev.txt) to enable.",
             encoding="utf-8",
         )
 
 
-def _write_html_report(
-    out: Path, results_obj: dict[str, Any], telemetry_rows: list[dict[str, Any]]
-) -> None:
-    from html import escape
-
-    tests: list[dict[str, Any]] = results_obj.get("tests", [])
-    test_rows = "".join(
-        (
-            f"<tr>"
-            f"<td>{escape(str(t.get('name', '')))}</td>"
-            f"<td>{escape(str(t.get('module', '')))}</td>"
-            f"<td class=\"{'ok' if t.get('ok') else 'fail'}\">"
-            f"{'PASS' if t.get('ok') else 'FAIL'}</td>"
-            f"<td>{t.get('duration_s')}</td>"
-            f"</tr>"
-        )
-        for t in tests
-    )
-
-    tele_rows = "".join(
-        (
-            f"<tr>"
-            f"<td>{escape(str(r.get('stage', '')))}</td>"
-            f"<td>{escape(str(r.get('name', '')))}</td>"
-            f"<td>{r.get('duration_s')}</td>"
-            f"<td><pre style=\"margin:0\">{escape(json.dumps(r.get('meta')))}</pre></td>"
-            f"</tr>"
-        )
-        for r in telemetry_rows
-    )
-
-    passed = sum(1 for t in tests if t.get("ok"))
-    failed = sum(1 for t in tests if not t.get("ok"))
-    artifacts_cnt = len(results_obj.get("artifacts", {}))
-
-    html = f"""<!doctype html>
+# Static report skeleton; CSS braces are doubled for str.format
+_HTML_TEMPLATE = """<!doctype html>
 <html lang="en">
 <meta charset="utf-8">
 <title>Pipeline Report</title>
@@ -260,23 +459,76 @@ def _write_html_report(
 </footer>
 </html>
 """
+
+
+def _write_html_report(out: Path, results_obj: dict[str, Any], telemetry: Telemetry) -> None:
+    dumps = _json_str
+    tests: list[dict[str, Any]] = results_obj.get("tests", [])
+
+    test_parts: list[str] = []
+    passed = 0
+    for t in tests:
+        get = t.get
+        ok = bool(get("ok"))
+        passed += ok
+        ok_class, ok_label = ("ok", "PASS") if ok else ("fail", "FAIL")
+        test_parts.append(
+            f"<tr>"
+            f"<td>{str(get('name', '')).translate(_HTML_ESC)}</td>"
+            f"<td>{str(get('module', '')).translate(_HTML_ESC)}</td>"
+            f'<td class="{ok_class}">{ok_label}</td>'
+            f"<td>{get('duration_s')}</td>"
+            f"</tr>"
+        )
+    test_rows = "".join(test_parts)
+    failed = len(tests) - passed
+
+    tele_rows = "".join(
+        [
+            f"<tr>"
+            f"<td>{stage.translate(_HTML_ESC)}</td>"
+            f"<td>{name.translate(_HTML_ESC)}</td>"
+            f"<td>{dur}</td>"
+            f'<td><pre style="margin:0">{dumps(meta).translate(_HTML_ESC)}</pre></td>'
+            f"</tr>"
+            for stage, name, dur, meta in telemetry.rows()
+        ]
+    )
+
+    artifacts_cnt = len(results_obj.get("artifacts", {}))
+
+    html = _HTML_TEMPLATE.format(
+        artifacts_cnt=artifacts_cnt,
+        passed=passed,
+        failed=failed,
+        test_rows=test_rows,
+        tele_rows=tele_rows,
+    )
     (out / "report.html").write_text(html, encoding="utf-8")
 
 
 # =================================== Entry point ===================================
-def run_pipeline(config_path: str, out_dir: str, *, dry_run: bool = False) -> int:
+def run_pipeline(
+    config_path: str,
+    out_dir: str,
+    *,
+    dry_run: bool = False,
+    jobs: int | None = None,
+    cache: bool = False,
+) -> int:
     """
     Run a config-driven build+test pipeline.
+    Modules (in dependency waves, then tests) run concurrently on up to `jobs` threads.
+    With cache=True, unchanged modules reuse digests from out_dir/.digest_cache.json.
     Returns exit code: 0 on success, 1 if any test fails, 2 for config errors.
     """
     try:
-        validate_config(config_path)
         cfg = _load_config(config_path)
+        waves = _validate_cfg(cfg)
     except ConfigError as e:
         print(json.dumps({"error": "config_error", "message": str(e)}))
         return 2
 
-    modules: list[dict[str, Any]] = list(cfg.get("modules", []) or [])
     tests: list[dict[str, Any]] = list(cfg.get("tests", []) or [])
 
     out = Path(out_dir)
@@ -284,71 +536,89 @@ def run_pipeline(config_path: str, out_dir: str, *, dry_run: bool = False) -> in
 
     telemetry_csv = out / "telemetry.csv"
     ndjson_path = out / "events.ndjson"
+    cache_path = out / ".digest_cache.json"
     artifacts: dict[str, str] = {}
     failures = 0
     results: list[dict[str, Any]] = []
-    telemetry_rows: list[dict[str, Any]] = []
+    telemetry = Telemetry()
 
     # Define once; assign in branches (avoids mypy redefinition)
     results_obj: dict[str, Any]
 
-    # Dry-run: write headers + empty results
+    # Dry-run: write headers + compact empty results; HTML only if SIM_DRY_HTML is set
     if dry_run:
         with telemetry_csv.open("w", newline="", encoding="utf-8") as f:
-            csv.writer(f).writerow(["stage", "name", "duration_s", "meta"])
+            csv.writer(f).writerow(TELEMETRY_FIELDS)
         ndjson_path.write_text("", encoding="utf-8")
         results_obj = {"dry_run": True, "artifacts": {}, "tests": [], "failures": 0}
-        (out / "results.json").write_text(json.dumps(results_obj, indent=2), encoding="utf-8")
-        _write_html_report(out, results_obj, telemetry_rows)
+        (out / "results.json").write_bytes(_json_bytes(results_obj))
+        if os.environ.get("SIM_DRY_HTML"):
+            _write_html_report(out, results_obj, telemetry)
         return 0
 
     # Normal run
     with (
         telemetry_csv.open("w", newline="", encoding="utf-8") as f_csv,
-        ndjson_path.open("w", encoding="utf-8") as f_nd,
+        ndjson_path.open("wb", buffering=1 << 20) as f_nd,
     ):
         writer = csv.writer(f_csv)
-        writer.writerow(["stage", "name", "duration_s", "meta"])
-
-        # Build
-        for m in modules:
-            name = str(m["name"])
-            payload = str(m.get("payload", ""))
-            seconds = float(m.get("seconds", 0.2))
-            digest, dur = _do_work(name, payload, seconds)
+        writer.writerow(TELEMETRY_FIELDS)
+
+        # Build: each dependency wave runs concurrently, with a barrier between waves.
+        # Rows follow wave order (config order when no module declares depends_on).
+        build_tasks: list[tuple[str, str, float]] = []
+        build_done: list[tuple[str, float, bool]] = []
+        digest_cache = _load_digest_cache(cache_path) if cache else {}
+        current_cache: dict[str, str] = {}
+        widest = max((len(w) for w in waves), default=0)
+        with ThreadPoolExecutor(max_workers=_max_workers(jobs, widest)) as ex:
+            for wave in waves:
+                tasks = [
+                    (str(m["name"]), str(m.get("payload", "")), float(m.get("seconds", 0.2)))
+                    for m in wave
+                ]
+                build_done.extend(ex.map(lambda a: _build_module(a, digest_cache), tasks))
+                build_tasks.extend(tasks)
+
+        build_rows: list[TelemetryRow] = []
+        for (name, payload, _), (digest, dur, hit) in zip(build_tasks, build_done, strict=True):
             artifacts[name] = digest
-            row = {"stage": "build", "name": name, "duration_s": round(dur, 4), "meta": digest}
-            telemetry_rows.append(row)
-            writer.writerow(["build", name, f"{dur:.4f}", digest])
-            f_nd.write(json.dumps(row, ensure_ascii=False) + "\n")
-
-        # Test
-        for t in tests:
-            t_name = str(t["name"])
-            target = str(t.get("module", ""))
-            seconds = float(t.get("seconds", 0.1))
+            current_cache[_cache_key(name, payload)] = digest
+            meta = {"digest": digest, "cache_hit": True} if hit else digest
+            build_rows.append(TelemetryRow("build", name, round(dur, 4), meta))
+        if cache:  # only this config's modules are kept, so stale entries don't pile up
+            cache_path.write_bytes(_json_bytes(current_cache))
+        _write_phase_rows(writer, f_nd, build_rows)
+        telemetry.extend(build_rows)
+
+        # Test (starts only after every build has finished)
+        test_tasks = [
+            (str(t["name"]), str(t.get("module", "")), float(t.get("seconds", 0.1))) for t in tests
+        ]
+        with ThreadPoolExecutor(max_workers=_max_workers(jobs, len(test_tasks))) as ex:
+            test_done = list(ex.map(lambda a: _do_work(*a), test_tasks))
+
+        test_rows: list[TelemetryRow] = []
+        artifacts_get = artifacts.get
+        res_append = results.append
+        for t, (t_name, target, _), (_, tdur) in zip(tests, test_tasks, test_done, strict=True):
             expected = t.get("expected_digest")
-
-            _, tdur = _do_work(t_name, target, seconds)
-            ok = (expected is None) or (expected == artifacts.get(target))
+            ok = (expected is None) or (expected == artifacts_get(target))
 
             t_row = {"name": t_name, "module": target, "ok": ok, "duration_s": round(tdur, 4)}
-            results.append(t_row)
-            meta = {"ok": ok}
-            tele = {"stage": "test", "name": t_name, "duration_s": round(tdur, 4), "meta": meta}
-            telemetry_rows.append(tele)
-
-            writer.writerow(["test", t_name, f"{tdur:.4f}", json.dumps(meta)])
-            f_nd.write(json.dumps(tele, ensure_ascii=False) + "\n")
+            res_append(t_row)
+            test_rows.append(TelemetryRow("test", t_name, round(tdur, 4), {"ok": ok}))
 
             if not ok:
                 failures += 1
+        _write_phase_rows(writer, f_nd, test_rows)
+        telemetry.extend(test_rows)
 
     # Single (unannotated) assignment — no redefinition
     results_obj = {"failures": failures, "tests": results, "artifacts": artifacts}
-    (out / "results.json").write_text(json.dumps(results_obj, indent=2), encoding="utf-8")
+    (out / "results.json").write_bytes(_json_bytes(results_obj, indent=True))
 
-    _try_parquet_exports(out, telemetry_rows, results_obj)
-    _write_html_report(out, results_obj, telemetry_rows)
+    _try_parquet_exports(out, telemetry, results_obj)
+    _write_html_report(out, results_obj, telemetry)
 
     return 1 if failures else 0
@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import tempfile
 from pathlib import Path
 
-from sim.runner import explain_config, run_pipeline, validate_config
+import pytest
+import yaml
+
+from sim import runner
+from sim.runner import (
+    DependencyCycleError,
+    InvalidDependsOnError,
+    UnknownDependencyError,
+    UnknownHashAlgorithmError,
+    explain_config,
+    run_pipeline,
+    validate_config,
+)
 
 SAMPLE = """\
 modules:
@@ -30,6 +43,41 @@ tests:
     expected_digest: "WRONG"
 """
 
+SAMPLE_MULTI = """\
+modules:
+  - name: core
+    payload: "src@abc123"
+    seconds: 0.0
+  - name: utils
+    payload: "src@def456"
+    seconds: 0.0
+  - name: cli
+    payload: "src@0a1b2c"
+    seconds: 0.0
+tests:
+  - name: unit-core
+    module: core
+    seconds: 0.0
+  - name: unit-utils
+    module: utils
+    seconds: 0.0
+"""
+
+SAMPLE_DEPS = """\
+modules:
+  - name: app
+    payload: "src@0a1b2c"
+    seconds: 0.0
+    depends_on: [core, utils]
+  - name: utils
+    payload: "src@def456"
+    seconds: 0.0
+    depends_on: [core]
+  - name: core
+    payload: "src@abc123"
+    seconds: 0.0
+"""
+
 
 def _write(tmp: Path, name: str, text: str) -> Path:
     p = tmp / name
@@ -68,3 +116,125 @@ def test_run_failure_exit_code_one():
         out = tmp / "build"
         code = run_pipeline(str(cfg), str(out))
         assert code == 1
+
+
+def test_yaml_loader_uses_libyaml_when_available():
+    if yaml.__with_libyaml__:
+        assert runner._Loader is yaml.CSafeLoader
+
+
+def test_run_parallel_keeps_config_order():
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        cfg = _write(tmp, "multi.yml", SAMPLE_MULTI)
+        outs = {}
+        for jobs in (1, 4):
+            out = tmp / f"build-{jobs}"
+            assert run_pipeline(str(cfg), str(out), jobs=jobs) == 0
+            outs[jobs] = json.loads((out / "results.json").read_text())
+        assert list(outs[4]["artifacts"]) == ["core", "utils", "cli"]
+        assert [t["name"] for t in outs[4]["tests"]] == ["unit-core", "unit-utils"]
+        assert outs[1]["artifacts"] == outs[4]["artifacts"]
+
+
+def test_run_builds_modules_in_dependency_order():
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        cfg = _write(tmp, "deps.yml", SAMPLE_DEPS)
+        out = tmp / "build"
+        assert run_pipeline(str(cfg), str(out)) == 0
+        res = json.loads((out / "results.json").read_text())
+        assert list(res["artifacts"]) == ["core", "utils", "app"]
+
+
+def test_validate_rejects_bad_dependencies():
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        cycle = _write(tmp, "cycle.yml", SAMPLE_DEPS + "    depends_on: [app]\n")
+        with pytest.raises(DependencyCycleError):
+            validate_config(str(cycle))
+        unknown = _write(tmp, "unknown.yml", SAMPLE_DEPS.replace("[core]", "[nope]"))
+        with pytest.raises(UnknownDependencyError):
+            validate_config(str(unknown))
+        not_list = _write(tmp, "not_list.yml", SAMPLE_DEPS.replace("[core]", "5"))
+        with pytest.raises(InvalidDependsOnError):
+            validate_config(str(not_list))
+        assert run_pipeline(str(not_list), str(tmp / "build")) == 2
+
+
+def test_dry_run_skips_html_report(monkeypatch):
+    monkeypatch.delenv("SIM_DRY_HTML", raising=False)
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        cfg = _write(tmp, "ok.yml", SAMPLE)
+        out = tmp / "build"
+        assert run_pipeline(str(cfg), str(out), dry_run=True) == 0
+        assert json.loads((out / "results.json").read_text())["dry_run"] is True
+        assert not (out / "report.html").exists()
+
+        monkeypatch.setenv("SIM_DRY_HTML", "1")
+        out_html = tmp / "build-html"
+        assert run_pipeline(str(cfg), str(out_html), dry_run=True) == 0
+        assert (out_html / "report.html").exists()
+
+
+def test_run_digest_cache_skips_unchanged_modules():
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        cfg = _write(tmp, "ok.yml", SAMPLE)
+        out = tmp / "build"
+        assert run_pipeline(str(cfg), str(out), cache=True) == 0
+        assert (out / ".digest_cache.json").exists()
+        assert run_pipeline(str(cfg), str(out), cache=True) == 0
+        events = [json.loads(line) for line in (out / "events.ndjson").read_text().splitlines()]
+        assert events[0]["meta"] == {
+            "digest": "4fc41e5669eafc53d839cd3f1f8c5fa4b5406f85ea35f94da8a4d9151e7523de",
+            "cache_hit": True,
+        }
+        res = json.loads((out / "results.json").read_text())
+        assert res["failures"] == 0
+
+
+def test_run_parquet_exports():
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        cfg = _write(tmp, "ok.yml", SAMPLE)
+        out = tmp / "build"
+        assert run_pipeline(str(cfg), str(out)) == 0
+        assert not (out / "parquet_export_failed.txt").exists()
+        assert (out / "results.parquet").exists()
+        tele = pq.read_table(out / "telemetry.parquet")
+        assert tele.schema.field("meta").type == pa.string()
+        assert tele.column("meta").to_pylist()[1] == '{"ok":true}'
+
+
+def test_run_digest_cache_ignores_corrupt_entries():
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        cfg = _write(tmp, "ok.yml", SAMPLE)
+        out = tmp / "build"
+        out.mkdir()
+        (out / ".digest_cache.json").write_text('{"sha256\\u0000core\\u0000src@abc123": 123}')
+        assert run_pipeline(str(cfg), str(out), cache=True) == 0
+        res = json.loads((out / "results.json").read_text())
+        assert res["artifacts"]["core"] == (
+            "4fc41e5669eafc53d839cd3f1f8c5fa4b5406f85ea35f94da8a4d9151e7523de"
+        )
+
+
+def test_sim_hash_blake2b(monkeypatch):
+    monkeypatch.setattr(runner, "_HASH_ALGO", "blake2b")
+    runner._digest.cache_clear()
+    try:
+        expected = hashlib.blake2b(b"coresrc@abc123", digest_size=32).hexdigest()
+        assert runner._digest("core", "src@abc123") == expected
+    finally:
+        runner._digest.cache_clear()
+
+
+def test_sim_hash_rejects_unknown_algorithm():
+    assert runner._hash_algo(" BLAKE2b ") == "blake2b"
+    with pytest.raises(UnknownHashAlgorithmError):
+        runner._hash_algo("md5")